@@ -203,6 +203,7 @@ class Round:
 
 class GameState:
   SPEAKER_COUNT = 3
+  TRANSFORM_CACHE_SIZE = 256
 
   BY_TEAM = {}
 
@@ -229,6 +230,9 @@ class GameState:
     self.widq = collections.deque()
     self.wids = {}
 
+    # (speaker, text) -> (alt_text, canonical answer form of alt_text)
+    self.transform_cache = collections.OrderedDict()
+
   async def on_wait(self, session, wid):
     now = time.time()
     self.widq.append((wid, now))
@@ -284,8 +288,29 @@ class GameState:
     await self.mayor_say("Thanks for participating in tonight’s debate. As your "
                          "participation prize, have some toy BAZOOKAS.")
 
-  async def try_answer(self, text):
-    canonical = " ".join(re.findall(r"\w+", text.upper()))
+  @staticmethod
+  def canonicalize(text):
+    return " ".join(re.findall(r"\w+", text.upper()))
+
+  async def cached_transform(self, speaker, text):
+    key = (speaker, text)
+    result = self.transform_cache.get(key)
+    if result:
+      self.transform_cache.move_to_end(key)
+      return result
+
+    alt_text = await self.text_transform.transform(speaker, text)
+    result = (alt_text, self.canonicalize(alt_text))
+    if alt_text:
+      # Don't cache empty results; a failed translation should be retried.
+      self.transform_cache[key] = result
+      if len(self.transform_cache) > self.TRANSFORM_CACHE_SIZE:
+        self.transform_cache.popitem(last=False)
+    return result
+
+  async def try_answer(self, text, canonical=None):
+    if canonical is None:
+      canonical = self.canonicalize(text)
     async with self.cond:
       if self.current_clue and canonical == self.current_clue.answer:
         self.solved.add(canonical)
@@ -316,7 +341,8 @@ class GameState:
         wids = []
 
     if not speaker: return
-    alt_text = await self.text_transform.transform(speaker, text)
+    text = " ".join(text.split())
+    alt_text, canonical = await self.cached_transform(speaker, text)
 
     d = {"method": "add_chat",
          "who": f"Speaker {speaker}",
@@ -325,7 +351,9 @@ class GameState:
          "wids": list(wids)}
     await self.team.send_messages([d])
 
-    await self.try_answer(alt_text)
+    clue = self.current_clue
+    if clue and canonical == clue.answer:
+      await self.try_answer(alt_text, canonical)
 
 
 class ChatroomApp(scrum.ScrumApp):